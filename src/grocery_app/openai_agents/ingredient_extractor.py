@@ -1,12 +1,20 @@
 import os
+import ast
+import json
 import logging
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 import asyncio
 from agents import Agent, Runner, function_tool  # OpenAI Agents SDK
 from grocery_app.config import OPENAI_KEY
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Dishes whose extracted ingredients are remembered per agent, least recently used evicted first
+EXTRACTION_MEMO_MAX_ENTRIES = 1024
 
 # Set the OpenAI API key
 if OPENAI_KEY:
@@ -49,49 +57,102 @@ class AIngredientExtractorAgent:
             model="gpt-4o-mini",
             tools=[get_recipe_ingredients]
         )
+        # LRU memo keyed by normalized dish name, shared by the sync and async entrypoints;
+        # failures raise and are not cached
+        self._memo: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
 
     def extract_ingredients(self, dish_name: str) -> List[str]:
-        logging.info(f"Extracting ingredients for: {dish_name}")
-        prompt = f"""
+        """
+        Blocking entrypoint; runs the agent on a fresh event loop via asyncio.run.
+        Code already inside an event loop must await extract_ingredients_async instead.
+        """
+        dish_key = dish_name.strip().lower()
+        try:
+            ingredients = self._memo_get(dish_key)
+            if ingredients is None:
+                ingredients = self._memo_put(dish_key, asyncio.run(self._run_extraction(dish_key)))
+            return list(ingredients)
+        except Exception as e:
+            logger.error("AI extraction failed for '%s': %s", dish_name, e)
+            return [f"AI extraction failed for {dish_name}: {e}"]
+
+    async def extract_ingredients_async(self, dish_name: str) -> List[str]:
+        """
+        Awaitable variant for callers that already run an event loop, so several
+        dishes can be extracted concurrently on that one loop.
+        """
+        dish_key = dish_name.strip().lower()
+        try:
+            ingredients = self._memo_get(dish_key)
+            if ingredients is None:
+                ingredients = self._memo_put(dish_key, await self._run_extraction(dish_key))
+            return list(ingredients)
+        except Exception as e:
+            logger.error("AI extraction failed for '%s': %s", dish_name, e)
+            return [f"AI extraction failed for {dish_name}: {e}"]
+
+    def _memo_get(self, dish_key: str) -> Optional[Tuple[str, ...]]:
+        with self._memo_lock:
+            ingredients = self._memo.get(dish_key)
+            if ingredients is not None:
+                self._memo.move_to_end(dish_key)
+            return ingredients
+
+    def _memo_put(self, dish_key: str, ingredients: Tuple[str, ...]) -> Tuple[str, ...]:
+        with self._memo_lock:
+            self._memo[dish_key] = ingredients
+            self._memo.move_to_end(dish_key)
+            if len(self._memo) > EXTRACTION_MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+        return ingredients
+
+    async def _run_extraction(self, dish_name: str) -> Tuple[str, ...]:
+        logger.info("Extracting ingredients for: %s", dish_name)
+        result = await Runner.run(self.agent, self._build_prompt(dish_name))
+        logger.info("AI agent result for '%s': %s", dish_name, result.final_output)
+        return self._parse_response(dish_name, result.final_output)
+
+    @staticmethod
+    def _build_prompt(dish_name: str) -> str:
+        return f"""
         Please provide the main raw ingredients needed to cook '{dish_name}'.
         Only include vegetables, proteins, grains, dairy, and other main components. Do NOT include spices, oil, salt, pepper, or pantry staples.
         Return a Python list of ingredient strings with quantities where appropriate.
         """
+
+    @staticmethod
+    def _parse_response(dish_name: str, final_output: str) -> Tuple[str, ...]:
         try:
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-            if loop and loop.is_running():
-                import nest_asyncio
-                nest_asyncio.apply()
-                result = asyncio.run(Runner.run(self.agent, prompt))
-            else:
-                result = asyncio.run(Runner.run(self.agent, prompt))
-            logging.info(f"AI agent result for '{dish_name}': {result.final_output}")
-            import ast
-            try:
-                response_text = result.final_output.strip()
-                if '[' in response_text and ']' in response_text:
-                    start = response_text.find('[')
-                    end = response_text.rfind(']') + 1
-                    list_str = response_text[start:end]
+            response_text = final_output.strip()
+            if '[' in response_text and ']' in response_text:
+                start = response_text.find('[')
+                end = response_text.rfind(']') + 1
+                list_str = response_text[start:end]
+                # JSON is the cheap path; anything with a single quote (Python-style quoting or an
+                # apostrophe) goes straight to literal_eval, since swapping quotes would corrupt "farmer's"
+                if "'" in list_str:
                     ingredients = ast.literal_eval(list_str)
-                    if isinstance(ingredients, list):
-                        return [str(ingredient).strip() for ingredient in ingredients]
-                delimiters = [',', ';', '\n', '•', '-']
-                for delimiter in delimiters:
-                    if delimiter in response_text:
-                        ingredients = [item.strip() for item in response_text.split(delimiter) if item.strip()]
-                        if len(ingredients) > 1:
-                            return ingredients
-                return [response_text.strip()]
-            except (ValueError, SyntaxError):
-                logging.warning(f"Parsing failed for '{dish_name}', returning raw response.")
-                return [result.final_output.strip()]
-        except Exception as e:
-            logging.error(f"AI extraction failed for '{dish_name}': {e}")
-            return [f"AI extraction failed for {dish_name}: {e}"]
+                else:
+                    try:
+                        ingredients = json.loads(list_str)
+                    except ValueError:
+                        ingredients = ast.literal_eval(list_str)
+                if isinstance(ingredients, list):
+                    return tuple(str(ingredient).strip() for ingredient in ingredients)
+            delimiters = [',', ';', '\n', '•', '-']
+            for delimiter in delimiters:
+                if delimiter in response_text:
+                    ingredients = [item.strip() for item in response_text.split(delimiter) if item.strip()]
+                    if len(ingredients) > 1:
+                        return tuple(ingredients)
+            return (response_text.strip(),)
+        except (ValueError, SyntaxError):
+            logger.warning("Parsing failed for '%s', returning raw response.", dish_name)
+            return (final_output.strip(),)
+
+# Built once at import so callers share the Agent and its extraction cache
+_AGENT = AIngredientExtractorAgent()
 
 def get_ingredient_extractor_agent() -> AIngredientExtractorAgent:
-    return AIngredientExtractorAgent() 
\ No newline at end of file
+    return _AGENT
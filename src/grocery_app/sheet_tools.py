@@ -1,11 +1,23 @@
 # src/grocery_app/sheets_tool.py
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
 import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from itertools import zip_longest
 
+import google_auth_httplib2
+import httplib2
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from grocery_app.config import GOOGLE_SHEETS_CREDENTIALS_JSON, GROCERIES_INVENTORY_SHEET_ID
+from grocery_app.units import canonical_unit
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
@@ -15,56 +27,228 @@ if not GOOGLE_SHEETS_CREDENTIALS_JSON:
 if not GROCERIES_INVENTORY_SHEET_ID:
     raise ValueError("GROCERIES_INVENTORY_SHEET_ID environment variable is required")
 
-_creds = Credentials.from_service_account_file(
-    GOOGLE_SHEETS_CREDENTIALS_JSON, scopes=SCOPES
-)
-_svc = build("sheets", "v4", credentials=_creds).spreadsheets()
+# Credentials and the client are built on first use, so importing this module
+# (e.g. on a Streamlit cold start) costs nothing until a sheet is actually touched
+@lru_cache(maxsize=1)
+def _creds() -> Credentials:
+    return Credentials.from_service_account_file(
+        GOOGLE_SHEETS_CREDENTIALS_JSON, scopes=SCOPES
+    )
+
+
+@lru_cache(maxsize=1)
+def _svc():
+    # Use the discovery document bundled with googleapiclient: no HTTP fetch or file cache
+    return build(
+        "sheets", "v4", credentials=_creds(), static_discovery=True, cache_discovery=False
+    ).spreadsheets()
+
+
+# httplib2.Http is not thread-safe, so a request borrows an authorized connection from
+# this pool for its duration. Streamlit runs each rerun on a fresh thread, so the pool
+# (not a thread-local) is what lets keep-alive connections survive between reruns.
+_http_pool: List[google_auth_httplib2.AuthorizedHttp] = []
+_http_pool_lock = threading.Lock()
+
+
+@contextmanager
+def _borrowed_http():
+    with _http_pool_lock:
+        http = _http_pool.pop() if _http_pool else None
+    if http is None:
+        http = google_auth_httplib2.AuthorizedHttp(_creds(), http=httplib2.Http(timeout=60))
+    try:
+        yield http
+    finally:
+        with _http_pool_lock:
+            _http_pool.append(http)
+
+
+# googleapiclient retries 429/5xx responses itself, with randomized exponential backoff
+# (appends excepted, see _execute_append)
+SHEETS_NUM_RETRIES = 5
+# Caps in-flight Sheets requests across threads to stay inside the per-user quota;
+# this also bounds the connection pool at the same size
+_request_slots = threading.BoundedSemaphore(10)
+
+
+def _execute(request, num_retries: int = SHEETS_NUM_RETRIES):
+    """Run a Sheets API request over a pooled keep-alive connection."""
+    with _request_slots, _borrowed_http() as http:
+        return request.execute(http=http, num_retries=num_retries)
+
+
+def _execute_append(request):
+    """Run a values.append, retrying only on 429.
+
+    An append isn't idempotent: a 5xx or dropped connection may arrive after the rows were
+    written, and resending would add them twice. A 429 means the request was rejected unapplied.
+    """
+    for attempt in range(SHEETS_NUM_RETRIES + 1):
+        try:
+            return _execute(request, num_retries=0)
+        except HttpError as e:
+            if e.resp.status != 429 or attempt == SHEETS_NUM_RETRIES:
+                raise
+            time.sleep(random.random() * 2 ** attempt)
+
+
+# Reads return typed cell values (numbers stay numbers, dates as display strings) and
+# only the values array, which keeps responses small and skips numeric string parsing.
+# Column-major payloads don't repeat per-row array brackets or blank-row padding on long sheets.
+_READ_OPTIONS = {
+    "majorDimension": "COLUMNS",
+    "valueRenderOption": "UNFORMATTED_VALUE",
+    "dateTimeRenderOption": "FORMATTED_STRING",
+    "fields": "values",
+}
+
+# (spreadsheet_id, sheet_name) -> (expires_at, {item_key: sheet row number}), filled by the item readers.
+# The TTL bounds how long edits made directly in the sheet can be masked.
+ROW_INDEX_TTL_SECONDS = 60
+_row_index_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, int]]] = {}
+
+# (spreadsheet_id, sheet_name) -> (expires_at, parsed rows) shared by the get_* readers.
+# Cached lists are returned as-is, so callers must treat them as read-only.
+READ_CACHE_TTL_SECONDS = 30
+_read_cache: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = {}
+
+
+def _cached_rows(spreadsheet_id: str, sheet_name: str) -> Optional[List[Dict]]:
+    """Return the parsed rows last read from a sheet, or None if missing or expired."""
+    cached = _read_cache.get((spreadsheet_id, sheet_name))
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[1]
+
+
+def _store_rows(spreadsheet_id: str, sheet_name: str, rows: List[Dict]) -> List[Dict]:
+    _read_cache[(spreadsheet_id, sheet_name)] = (time.monotonic() + READ_CACHE_TTL_SECONDS, rows)
+    return rows
+
+
+def _invalidate_sheet(spreadsheet_id: str, sheet_name: str, rows_moved: bool = True) -> None:
+    """Forget cached rows after a write; row positions survive in-place updates."""
+    _read_cache.pop((spreadsheet_id, sheet_name), None)
+    if rows_moved:
+        _row_index_cache.pop((spreadsheet_id, sheet_name), None)
+
+
+def _value_rows(value_range: Dict) -> List[List]:
+    """Transpose a column-major value range back into rows, padding short columns with ""."""
+    return [list(row) for row in zip_longest(*value_range.get("values", []), fillvalue="")]
+
+
+def _read_item_rows(spreadsheet_id: str, sheet_name: str) -> List[Dict]:
+    """Read {sheet_name}!A2:C as item rows and refresh both caches for that sheet."""
+    resp = _execute(_svc().values().get(
+        spreadsheetId=spreadsheet_id,
+        range=f"{sheet_name}!A2:C",
+        **_READ_OPTIONS
+    ))
+    return _cache_item_rows(spreadsheet_id, sheet_name, _value_rows(resp))
+
+
+def _cache_item_rows(spreadsheet_id: str, sheet_name: str, values: List[List]) -> List[Dict]:
+    """Parse raw A2:C values into item rows and store them with their row positions."""
+    # Pad short rows up front so each one unpacks as (item, quantity, unit) without length checks
+    # Text cells can come back as numbers (e.g. an item named 7), hence str()
+    padded = [(n, (row + ["", ""])[:3]) for n, row in enumerate(values, start=2) if row and str(row[0]).strip()]
+    rows = [
+        {"item": str(item).strip(), "item_key": str(item).strip().lower(), "quantity": float(qty) if qty else 0.0, "unit": str(unit).strip()}
+        for _, (item, qty, unit) in padded
+    ]
+    # Built back to front so the first row of a duplicated item wins
+    row_index = {row["item_key"]: n for (n, _), row in zip(reversed(padded), reversed(rows))}
+    _row_index_cache[(spreadsheet_id, sheet_name)] = (time.monotonic() + ROW_INDEX_TTL_SECONDS, row_index)
+    return _store_rows(spreadsheet_id, sheet_name, rows)
+
+
+def _parse_shopping_list_rows(values: List[List]) -> List[Dict]:
+    """Parse raw ShoppingLists!A2:E values into shopping list metadata dicts."""
+    padded = [(row + ["", "", "", ""])[:5] for row in values if row and str(row[0]).strip()]
+    return [
+        {
+            "list_id": str(list_id).strip(),
+            "date_created": str(date_created).strip(),
+            "meal_plan": str(meal_plan).strip(),
+            "total_items": int(total_items) if total_items else 0,
+            "status": str(status).strip() if status else "active"
+        }
+        for list_id, date_created, meal_plan, total_items, status in padded
+    ]
+
+
+def _read_row_index(spreadsheet_id: str, sheet_name: str) -> Dict[str, int]:
+    """Read only the item column {sheet_name}!A2:A and cache {item_key: row number}."""
+    resp = _execute(_svc().values().get(
+        spreadsheetId=spreadsheet_id,
+        range=f"{sheet_name}!A2:A",
+        **_READ_OPTIONS
+    ))
+    items = (resp.get("values") or [[]])[0]
+    row_index = {}
+    for row_number, item in enumerate(items, start=2):
+        item_key = str(item).strip().lower()
+        if item_key:
+            row_index.setdefault(item_key, row_number)
+    _row_index_cache[(spreadsheet_id, sheet_name)] = (time.monotonic() + ROW_INDEX_TTL_SECONDS, row_index)
+    return row_index
+
+
+def _get_row_index(spreadsheet_id: str, sheet_name: str) -> Dict[str, int]:
+    """Return {item_key: row number} for a sheet, reading its item column only on a miss or expiry."""
+    cached = _row_index_cache.get((spreadsheet_id, sheet_name))
+    if cached is None or cached[0] <= time.monotonic():
+        return _read_row_index(spreadsheet_id, sheet_name)
+    return cached[1]
+
+
+# First row number of an A1 range such as "Sheet2!A7:C9" or "'My Sheet'!A7:C9"
+_A1_START_ROW_RE = re.compile(r"!\$?[A-Z]+\$?(\d+)")
+
+
+def _record_appended_rows(spreadsheet_id: str, sheet_name: str, items: List[str], resp: Dict) -> None:
+    """Extend a live row index with the rows values.append reports writing, so the next upsert skips a read."""
+    key = (spreadsheet_id, sheet_name)
+    cached = _row_index_cache.get(key)
+    match = _A1_START_ROW_RE.search(resp.get("updates", {}).get("updatedRange", ""))
+    # INSERT_ROWS lands after the first table; with a blank-row gap that is above
+    # rows already indexed, which it shifts down, so the index is only kept for a true tail append
+    if (
+        cached is None or cached[0] <= time.monotonic() or match is None
+        or int(match.group(1)) <= max(cached[1].values(), default=1)
+    ):
+        _row_index_cache.pop(key, None)
+        return
+    for row_number, item in enumerate(items, start=int(match.group(1))):
+        cached[1].setdefault(item.strip().lower(), row_number)
 
 
 def get_inventory(
     spreadsheet_id: Optional[str] = None,
     sheet_name: str = "Sheet1"
 ) -> List[Dict]:
-    """Read Sheet1!A2:C and return list of {"item", "quantity", "unit"}."""
+    """Read Sheet1!A2:C and return list of {"item", "item_key", "quantity", "unit"}."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
-    resp = _svc.values().get(
-        spreadsheetId=spreadsheet_id,
-        range=f"{sheet_name}!A2:C"
-    ).execute()
-    values = resp.get("values", [])
-    inventory = []
-    for row in values:
-        if not row or not row[0].strip():
-            continue
-        item = row[0].strip()
-        qty = float(row[1]) if len(row) > 1 and row[1] else 0.0
-        unit = row[2].strip() if len(row) > 2 and row[2] else ""
-        inventory.append({"item": item, "quantity": qty, "unit": unit})
-    return inventory
+    rows = _cached_rows(spreadsheet_id, sheet_name)
+    if rows is None:
+        rows = _read_item_rows(spreadsheet_id, sheet_name)
+    return rows
 
 
 def get_order_sheet(
     spreadsheet_id: Optional[str] = None,
     sheet_name: str = "Sheet2"
 ) -> List[Dict]:
-    """Read order sheet and return list of {"item", "quantity", "unit"}."""
+    """Read order sheet and return list of {"item", "item_key", "quantity", "unit"}."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
-    resp = _svc.values().get(
-        spreadsheetId=spreadsheet_id,
-        range=f"{sheet_name}!A2:C"
-    ).execute()
-    values = resp.get("values", [])
-    orders = []
-    for row in values:
-        if not row or not row[0].strip():
-            continue
-        item = row[0].strip()
-        qty = float(row[1]) if len(row) > 1 and row[1] else 0.0
-        unit = row[2].strip() if len(row) > 2 and row[2] else ""
-        orders.append({"item": item, "quantity": qty, "unit": unit})
-    return orders
+    rows = _cached_rows(spreadsheet_id, sheet_name)
+    if rows is None:
+        rows = _read_item_rows(spreadsheet_id, sheet_name)
+    return rows
 
 
 def get_shopping_lists(
@@ -74,34 +258,143 @@ def get_shopping_lists(
     """Read shopping lists sheet and return list of shopping lists with metadata."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
+    cached = _cached_rows(spreadsheet_id, sheet_name)
+    if cached is not None:
+        return cached
     try:
-        resp = _svc.values().get(
+        resp = _execute(_svc().values().get(
             spreadsheetId=spreadsheet_id,
-            range=f"{sheet_name}!A2:E"
-        ).execute()
-        values = resp.get("values", [])
-        shopping_lists = []
-        for row in values:
-            if not row or not row[0].strip():
-                continue
-            list_id = row[0].strip()
-            date_created = row[1].strip() if len(row) > 1 and row[1] else ""
-            meal_plan = row[2].strip() if len(row) > 2 and row[2] else ""
-            total_items = int(row[3]) if len(row) > 3 and row[3] else 0
-            status = row[4].strip() if len(row) > 4 and row[4] else "active"
-            shopping_lists.append({
-                "list_id": list_id,
-                "date_created": date_created,
-                "meal_plan": meal_plan,
-                "total_items": total_items,
-                "status": status
-            })
-        return shopping_lists
+            range=f"{sheet_name}!A2:E",
+            **_READ_OPTIONS
+        ))
+        shopping_lists = _parse_shopping_list_rows(_value_rows(resp))
+        return _store_rows(spreadsheet_id, sheet_name, shopping_lists)
     except Exception:
         # If sheet doesn't exist, return empty list
         return []
 
 
+def load_all_sheets(
+    spreadsheet_id: Optional[str] = None,
+    inventory_sheet: str = "Sheet1",
+    order_sheet: str = "Sheet2",
+    shopping_lists_sheet: str = "ShoppingLists"
+) -> Dict[str, List[Dict]]:
+    """Fetch inventory, orders and shopping lists with one values.batchGet and prime the read cache."""
+    if spreadsheet_id is None:
+        spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
+    try:
+        resp = _execute(_svc().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=[
+                f"{inventory_sheet}!A2:C",
+                f"{order_sheet}!A2:C",
+                f"{shopping_lists_sheet}!A2:E"
+            ],
+            **{**_READ_OPTIONS, "fields": "valueRanges(values)"}
+        ))
+    except Exception:
+        # The whole batch fails if any tab is missing (e.g. no list saved yet); read them one by one
+        return {
+            "inventory": get_inventory(spreadsheet_id, inventory_sheet),
+            "orders": get_order_sheet(spreadsheet_id, order_sheet),
+            "shopping_lists": get_shopping_lists(spreadsheet_id, shopping_lists_sheet)
+        }
+    inventory_range, order_range, lists_range = (resp.get("valueRanges", []) + [{}, {}, {}])[:3]
+    shopping_lists = _parse_shopping_list_rows(_value_rows(lists_range))
+    return {
+        "inventory": _cache_item_rows(spreadsheet_id, inventory_sheet, _value_rows(inventory_range)),
+        "orders": _cache_item_rows(spreadsheet_id, order_sheet, _value_rows(order_range)),
+        "shopping_lists": _store_rows(spreadsheet_id, shopping_lists_sheet, shopping_lists)
+    }
+
+
+# (spreadsheet_id, sheet_name) -> (numeric sheetId, grid row count) for grid-level batchUpdate
+# requests. A sheet's ID never changes, and appends only ever add grid rows, so the cached
+# row count is a lower bound; entries only go stale if the sheet is deleted or renamed.
+_sheet_grids: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+_SHEET_GRID_FIELDS = "sheets.properties(sheetId,title,gridProperties.rowCount)"
+
+
+def _store_sheet_grids(spreadsheet_id: str, resp: Dict) -> None:
+    for sheet in resp.get("sheets", []):
+        properties = sheet["properties"]
+        _sheet_grids[(spreadsheet_id, properties["title"])] = (
+            properties["sheetId"], properties.get("gridProperties", {}).get("rowCount", 0)
+        )
+
+
+def _get_sheet_grid(spreadsheet_id: str, sheet_name: str) -> Tuple[int, int]:
+    """Return (sheetId, row count) for a sheet title, fetching every sheet's on a miss."""
+    key = (spreadsheet_id, sheet_name)
+    if key not in _sheet_grids:
+        _store_sheet_grids(spreadsheet_id, _execute(_svc().get(
+            spreadsheetId=spreadsheet_id,
+            fields=_SHEET_GRID_FIELDS
+        )))
+        if key not in _sheet_grids:
+            raise ValueError(f"Sheet '{sheet_name}' not found")
+    return _sheet_grids[key]
+
+
+def _ensure_sheets(
+    spreadsheet_id: str,
+    sheets: List[Tuple[str, int, List[str]]]
+) -> Set[str]:
+    """Create any missing (title, column_count, headers) sheets in one batchUpdate; return titles created."""
+    resp = _execute(_svc().get(
+        spreadsheetId=spreadsheet_id,
+        fields=_SHEET_GRID_FIELDS
+    ))
+    _store_sheet_grids(spreadsheet_id, resp)
+    existing = {s["properties"]["title"]: s["properties"]["sheetId"] for s in resp.get("sheets", [])}
+    # Random IDs (not max + 1) so two sessions adding sheets at once don't pick the same one
+    taken_ids = set(existing.values())
+    requests = []
+    created = set()
+    for title, column_count, headers in sheets:
+        if title in existing or title in created:
+            continue
+        sheet_id = random.randrange(1, 2**31)
+        while sheet_id in taken_ids:
+            sheet_id = random.randrange(1, 2**31)
+        taken_ids.add(sheet_id)
+        requests.append({
+            "addSheet": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "title": title,
+                    "gridProperties": {
+                        "rowCount": 1000,
+                        "columnCount": column_count
+                    }
+                }
+            }
+        })
+        # Header row is written in the same request as the sheet itself
+        requests.append({
+            "updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                "rows": [{"values": [{"userEnteredValue": {"stringValue": h}} for h in headers]}],
+                "fields": "userEnteredValue"
+            }
+        })
+        created.add(title)
+    if requests:
+        _execute(_svc().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": requests}
+        ))
+        for request in requests:
+            if "addSheet" in request:
+                properties = request["addSheet"]["properties"]
+                _sheet_grids[(spreadsheet_id, properties["title"])] = (
+                    properties["sheetId"], properties["gridProperties"]["rowCount"]
+                )
+    return created
+
+
 def save_shopping_list(
     list_id: str,
     meal_plan: str,
@@ -112,96 +405,32 @@ def save_shopping_list(
     """Save a shopping list to Google Sheets."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
+    items_sheet_name = f"ShoppingList_{list_id}"
     try:
-        # First, ensure the shopping lists sheet exists
-        try:
-            _svc.values().get(
-                spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!A1"
-            ).execute()
-        except Exception:
-            # Create the sheet if it doesn't exist
-            _svc.batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={
-                    "requests": [
-                        {
-                            "addSheet": {
-                                "properties": {
-                                    "title": sheet_name,
-                                    "gridProperties": {
-                                        "rowCount": 1000,
-                                        "columnCount": 10
-                                    }
-                                }
-                            }
-                        }
-                    ]
-                }
-            ).execute()
-            
-            # Add headers
-            _svc.values().update(
-                spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!A1:E1",
-                valueInputOption="RAW",
-                body={"values": [["List ID", "Date Created", "Meal Plan", "Total Items", "Status"]]}
-            ).execute()
+        # Ensure the shopping lists sheet and this list's items sheet exist
+        created = _ensure_sheets(spreadsheet_id, [
+            (sheet_name, 10, ["List ID", "Date Created", "Meal Plan", "Total Items", "Status"]),
+            (items_sheet_name, 5, ["Item", "Quantity", "Unit", "Status"]),
+        ])
         
         # Add shopping list metadata
-        from datetime import datetime
         date_created = datetime.now().strftime("%Y-%m-%d %H:%M")
         total_items = len(shopping_items)
         
-        _svc.values().append(
+        _execute_append(_svc().values().append(
             spreadsheetId=spreadsheet_id,
             range=f"{sheet_name}!A:E",
             valueInputOption="RAW",
             insertDataOption="INSERT_ROWS",
             body={"values": [[list_id, date_created, meal_plan, total_items, "active"]]}
-        ).execute()
+        ))
         
-        # Save individual items to a separate sheet
-        items_sheet_name = f"ShoppingList_{list_id}"
-        try:
-            _svc.values().get(
-                spreadsheetId=spreadsheet_id,
-                range=f"{items_sheet_name}!A1"
-            ).execute()
-        except Exception:
-            # Create items sheet
-            _svc.batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={
-                    "requests": [
-                        {
-                            "addSheet": {
-                                "properties": {
-                                    "title": items_sheet_name,
-                                    "gridProperties": {
-                                        "rowCount": 1000,
-                                        "columnCount": 5
-                                    }
-                                }
-                            }
-                        }
-                    ]
-                }
-            ).execute()
-            
-            # Add headers
-            _svc.values().update(
+        # A freshly created items sheet only holds its header; re-saving a list clears old items
+        if items_sheet_name not in created:
+            _execute(_svc().values().clear(
                 spreadsheetId=spreadsheet_id,
-                range=f"{items_sheet_name}!A1:D1",
-                valueInputOption="RAW",
-                body={"values": [["Item", "Quantity", "Unit", "Status"]]}
-            ).execute()
-        
-        # Clear existing items and add new ones
-        _svc.values().clear(
-            spreadsheetId=spreadsheet_id,
-            range=f"{items_sheet_name}!A2:D"
-        ).execute()
+                range=f"{items_sheet_name}!A2:D"
+            ))
         
         # Add shopping items
         items_data = []
@@ -214,17 +443,20 @@ def save_shopping_list(
             ])
         
         if items_data:
-            _svc.values().append(
+            _execute(_svc().values().update(
                 spreadsheetId=spreadsheet_id,
-                range=f"{items_sheet_name}!A:D",
+                range=f"{items_sheet_name}!A2:D{len(items_data) + 1}",
                 valueInputOption="RAW",
-                insertDataOption="INSERT_ROWS",
                 body={"values": items_data}
-            ).execute()
+            ))
         
         return f"✅ Shopping list '{list_id}' saved with {total_items} items"
     except Exception as e:
         return f"❌ Error saving shopping list: {str(e)}"
+    finally:
+        # After the writes, so a concurrent read can't re-cache the pre-save rows
+        _invalidate_sheet(spreadsheet_id, sheet_name)
+        _invalidate_sheet(spreadsheet_id, items_sheet_name)
 
 
 def get_shopping_list_items(
@@ -237,32 +469,49 @@ def get_shopping_list_items(
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
     if sheet_name is None:
         sheet_name = f"ShoppingList_{list_id}"
+    cached = _cached_rows(spreadsheet_id, sheet_name)
+    if cached is not None:
+        return cached
     
     try:
-        resp = _svc.values().get(
+        resp = _execute(_svc().values().get(
             spreadsheetId=spreadsheet_id,
-            range=f"{sheet_name}!A2:D"
-        ).execute()
-        values = resp.get("values", [])
-        items = []
-        for row in values:
-            if not row or not row[0].strip():
-                continue
-            item = row[0].strip()
-            qty = float(row[1]) if len(row) > 1 and row[1] else 0.0
-            unit = row[2].strip() if len(row) > 2 and row[2] else ""
-            status = row[3].strip() if len(row) > 3 and row[3] else "pending"
-            items.append({
-                "item": item,
-                "quantity": qty,
-                "unit": unit,
-                "status": status
-            })
-        return items
+            range=f"{sheet_name}!A2:D",
+            **_READ_OPTIONS
+        ))
+        padded = [(row + ["", "", ""])[:4] for row in _value_rows(resp) if row and str(row[0]).strip()]
+        items = [
+            {
+                "item": str(item).strip(),
+                "quantity": float(qty) if qty else 0.0,
+                "unit": str(unit).strip(),
+                "status": str(status).strip() if status else "pending"
+            }
+            for item, qty, unit, status in padded
+        ]
+        return _store_rows(spreadsheet_id, sheet_name, items)
     except Exception:
         return []
 
 
+# (spreadsheet_id, sheet_name) -> (inventory rows, lookup); reused while the read cache returns the same rows
+_inventory_lookup_cache: Dict[Tuple[str, str], Tuple[List[Dict], Dict[str, Tuple[float, str, str]]]] = {}
+
+
+def _inventory_lookup(spreadsheet_id: str, sheet_name: str) -> Dict[str, Tuple[float, str, str]]:
+    """Map item_key -> (quantity, unit, canonical unit) for the current inventory."""
+    current_inventory = get_inventory(spreadsheet_id, sheet_name)
+    cached = _inventory_lookup_cache.get((spreadsheet_id, sheet_name))
+    if cached is not None and cached[0] is current_inventory:
+        return cached[1]
+    lookup = {
+        item["item_key"]: (item["quantity"], item["unit"], canonical_unit(item["unit"]))
+        for item in current_inventory
+    }
+    _inventory_lookup_cache[(spreadsheet_id, sheet_name)] = (current_inventory, lookup)
+    return lookup
+
+
 def generate_inventory_aware_shopping_list(
     required_ingredients: List[Dict],
     spreadsheet_id: Optional[str] = None,
@@ -271,16 +520,7 @@ def generate_inventory_aware_shopping_list(
     """Generate inventory-aware shopping list by subtracting current inventory from required ingredients."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
-    current_inventory = get_inventory(spreadsheet_id, inventory_sheet)
-    
-    # Create inventory lookup dictionary
-    inventory_lookup = {}
-    for item in current_inventory:
-        key = item["item"].lower().strip()
-        inventory_lookup[key] = {
-            "quantity": item["quantity"],
-            "unit": item["unit"]
-        }
+    inventory_lookup = _inventory_lookup(spreadsheet_id, inventory_sheet)
     
     shopping_list = []
     
@@ -289,13 +529,11 @@ def generate_inventory_aware_shopping_list(
         required_qty = ingredient["quantity"]
         required_unit = ingredient["unit"]
         
-        if item_name in inventory_lookup:
+        available_qty, available_unit, available_unit_key = inventory_lookup.get(item_name, (None, None, None))
+        if available_qty is not None:
             # Item exists in inventory
-            available_qty = inventory_lookup[item_name]["quantity"]
-            available_unit = inventory_lookup[item_name]["unit"]
-            
             # If units match, subtract available from required
-            if available_unit.lower() == required_unit.lower():
+            if available_unit_key == canonical_unit(required_unit):
                 needed_qty = max(0, required_qty - available_qty)
                 if needed_qty > 0:
                     shopping_list.append({
@@ -336,31 +574,133 @@ def add_to_order_sheet(
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
     try:
         # Check if item already exists in order sheet
-        existing_orders = get_order_sheet(spreadsheet_id, sheet_name)
-        for order in existing_orders:
-            if order["item"].lower() == item.lower():
-                # Update existing order
-                _svc.values().update(
-                    spreadsheetId=spreadsheet_id,
-                    range=f"{sheet_name}!A{existing_orders.index(order) + 2}:C{existing_orders.index(order) + 2}",
-                    valueInputOption="RAW",
-                    body={"values": [[item, quantity, unit]]}
-                ).execute()
-                return f"✅ Updated order for {item}: {quantity} {unit or 'units'}"
+        row = _get_row_index(spreadsheet_id, sheet_name).get(item.strip().lower())
+        if row is not None:
+            # Update existing order
+            _execute(_svc().values().update(
+                spreadsheetId=spreadsheet_id,
+                range=f"{sheet_name}!A{row}:C{row}",
+                valueInputOption="RAW",
+                body={"values": [[item, quantity, unit]]}
+            ))
+            _invalidate_sheet(spreadsheet_id, sheet_name, rows_moved=False)
+            return f"✅ Updated order for {item}: {quantity} {unit or 'units'}"
         
         # Add new order
-        _svc.values().append(
+        resp = _execute_append(_svc().values().append(
             spreadsheetId=spreadsheet_id,
             range=f"{sheet_name}!A:C",
             valueInputOption="RAW",
             insertDataOption="INSERT_ROWS",
             body={"values": [[item, quantity, unit]]}
-        ).execute()
+        ))
+        _invalidate_sheet(spreadsheet_id, sheet_name, rows_moved=False)
+        _record_appended_rows(spreadsheet_id, sheet_name, [item], resp)
         return f"✅ Added {item}: {quantity} {unit or 'units'} to order sheet"
     except Exception as e:
         return f"❌ Error adding to order sheet: {str(e)}"
 
 
+def add_rows_to_order_sheet(
+    rows: List[Tuple[str, float, str]],
+    spreadsheet_id: Optional[str] = None,
+    sheet_name: str = "Sheet2",
+) -> str:
+    """Append several (item, quantity, unit) rows to the order sheet in one request."""
+    if spreadsheet_id is None:
+        spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
+    if not rows:
+        return "✅ No items to add to order sheet"
+    try:
+        resp = _execute_append(_svc().values().append(
+            spreadsheetId=spreadsheet_id,
+            range=f"{sheet_name}!A:C",
+            valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
+            body={"values": [[item, quantity, unit] for item, quantity, unit in rows]}
+        ))
+        _invalidate_sheet(spreadsheet_id, sheet_name, rows_moved=False)
+        _record_appended_rows(spreadsheet_id, sheet_name, [item for item, _, _ in rows], resp)
+        return f"✅ Added {len(rows)} items to order sheet"
+    except Exception as e:
+        return f"❌ Error adding to order sheet: {str(e)}"
+
+
+def _cell_data(value) -> Dict:
+    """CellData for a raw value, matching what valueInputOption=RAW would store."""
+    if value is None or value == "":
+        return {}
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+
+def _overwrite_item_rows(
+    spreadsheet_id: str,
+    sheet_name: str,
+    rows: List[Tuple[str, float, str]]
+) -> None:
+    """Overwrite {sheet_name}!A2:C with (item, quantity, unit) rows in one updateCells request."""
+    try:
+        sheet_id, row_count = _get_sheet_grid(spreadsheet_id, sheet_name)
+        requests = []
+        # Unlike values.update, updateCells doesn't grow the grid to fit
+        if len(rows) + 1 > row_count:
+            requests.append({
+                "appendDimension": {
+                    "sheetId": sheet_id,
+                    "dimension": "ROWS",
+                    "length": len(rows) + 1 - row_count
+                }
+            })
+        # The range has no endRowIndex, so every A:C cell below the new rows is cleared too;
+        # the row index can't see trailing duplicates or blank-item rows left by an old layout
+        requests.append({
+            "updateCells": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "startRowIndex": 1,
+                    "startColumnIndex": 0,
+                    "endColumnIndex": 3
+                },
+                "rows": [{"values": [_cell_data(value) for value in row]} for row in rows],
+                "fields": "userEnteredValue"
+            }
+        })
+        _execute(_svc().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": requests}
+        ))
+        _sheet_grids[(spreadsheet_id, sheet_name)] = (sheet_id, max(row_count, len(rows) + 1))
+    except Exception:
+        _sheet_grids.pop((spreadsheet_id, sheet_name), None)
+        _invalidate_sheet(spreadsheet_id, sheet_name)
+        raise
+    # The new layout is known, so record it rather than forcing a re-read on the next write
+    _invalidate_sheet(spreadsheet_id, sheet_name)
+    row_index = {}
+    for row_number, (item, _, _) in enumerate(rows, start=2):
+        row_index.setdefault(item.strip().lower(), row_number)
+    _row_index_cache[(spreadsheet_id, sheet_name)] = (time.monotonic() + ROW_INDEX_TTL_SECONDS, row_index)
+
+
+def replace_order_sheet(
+    rows: List[Tuple[str, float, str]],
+    spreadsheet_id: Optional[str] = None,
+    sheet_name: str = "Sheet2",
+) -> str:
+    """Overwrite the order sheet with (item, quantity, unit) rows in one request."""
+    if spreadsheet_id is None:
+        spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
+    try:
+        _overwrite_item_rows(spreadsheet_id, sheet_name, rows)
+        return f"✅ Order sheet replaced with {len(rows)} items"
+    except Exception as e:
+        return f"❌ Error replacing order sheet: {str(e)}"
+
+
 def clear_order_sheet(
     spreadsheet_id: Optional[str] = None,
     sheet_name: str = "Sheet2",
@@ -370,10 +710,11 @@ def clear_order_sheet(
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
     try:
         # Clear all data except header
-        _svc.values().clear(
+        _execute(_svc().values().clear(
             spreadsheetId=spreadsheet_id,
             range=f"{sheet_name}!A2:C"
-        ).execute()
+        ))
+        _invalidate_sheet(spreadsheet_id, sheet_name)
         return "✅ Order sheet cleared"
     except Exception as e:
         return f"❌ Error clearing order sheet: {str(e)}"
@@ -389,16 +730,16 @@ def update_inventory_item(
     """Update existing row for `item`, or append if not found."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
-    inv = get_inventory(spreadsheet_id, sheet_name)
-    for idx, row in enumerate(inv, start=2):
-        if row["item"].lower() == item.lower():
-            _svc.values().update(
-                spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!A{idx}:C{idx}",
-                valueInputOption="RAW",
-                body={"values": [[item, quantity, unit]]}
-            ).execute()
-            return
+    row = _get_row_index(spreadsheet_id, sheet_name).get(item.strip().lower())
+    if row is not None:
+        _execute(_svc().values().update(
+            spreadsheetId=spreadsheet_id,
+            range=f"{sheet_name}!A{row}:C{row}",
+            valueInputOption="RAW",
+            body={"values": [[item, quantity, unit]]}
+        ))
+        _invalidate_sheet(spreadsheet_id, sheet_name, rows_moved=False)
+        return
     append_inventory_item(item, quantity, unit, spreadsheet_id, sheet_name)
 
 
@@ -412,13 +753,30 @@ def append_inventory_item(
     """Append a new row with item, quantity, unit."""
     if spreadsheet_id is None:
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
-    _svc.values().append(
+    resp = _execute_append(_svc().values().append(
         spreadsheetId=spreadsheet_id,
         range=f"{sheet_name}!A:C",
         valueInputOption="RAW",
         insertDataOption="INSERT_ROWS",
         body={"values": [[item, quantity, unit]]}
-    ).execute()
+    ))
+    _invalidate_sheet(spreadsheet_id, sheet_name, rows_moved=False)
+    _record_appended_rows(spreadsheet_id, sheet_name, [item], resp)
+
+
+def overwrite_inventory(
+    rows: List[Tuple[str, float, str]],
+    spreadsheet_id: Optional[str] = None,
+    sheet_name: str = "Sheet1",
+) -> str:
+    """Replace the whole inventory with (item, quantity, unit) rows in one request."""
+    if spreadsheet_id is None:
+        spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
+    try:
+        _overwrite_item_rows(spreadsheet_id, sheet_name, rows)
+        return f"✅ Inventory replaced with {len(rows)} items"
+    except Exception as e:
+        return f"❌ Error replacing inventory: {str(e)}"
 
 
 def clear_inventory_sheet(
@@ -430,10 +788,11 @@ def clear_inventory_sheet(
         spreadsheet_id = GROCERIES_INVENTORY_SHEET_ID
     try:
         # Clear all data except header
-        _svc.values().clear(
+        _execute(_svc().values().clear(
             spreadsheetId=spreadsheet_id,
             range=f"{sheet_name}!A2:C"
-        ).execute()
+        ))
+        _invalidate_sheet(spreadsheet_id, sheet_name)
         return "✅ Inventory sheet cleared"
     except Exception as e:
         return f"❌ Error clearing inventory sheet: {str(e)}"
@@ -1,6 +1,8 @@
+import asyncio
 import streamlit as st
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 import datetime
+import json
 from collections import Counter
 import uuid
 import re
@@ -11,49 +13,75 @@ from grocery_app.sheet_tools import (
     get_shopping_lists, 
     get_shopping_list_items,
     generate_inventory_aware_shopping_list,
-    clear_inventory_sheet,
-    append_inventory_item
+    overwrite_inventory,
+    append_inventory_item,
+    load_all_sheets
 )
 import openai
 from grocery_app.config import OPENAI_KEY
+from grocery_app.units import UNIT_ALIASES, canonical_unit
 import hashlib
 
 # --- CONFIG ---
 st.set_page_config(page_title="AI Meal Planner", layout="wide")
+# Dishes are extracted concurrently on one event loop; this bounds in-flight OpenAI requests
+MAX_CONCURRENT_EXTRACTIONS = 8
 
-def parse_ingredient_string(ingredient_str: str) -> Dict:
+# Quantity followed by a singular or plural unit, compiled once for every ingredient parsed
+_QTY_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(cups?|tablespoons?|teaspoons?|pounds?|lbs?|grams?|g|kilograms?|kg|ounces?|oz|pieces?|cloves?|bottles?|cans?|packets?|bunch(?:es)?|heads?)\s+(.+)$',
+    re.IGNORECASE
+)
+_PAREN_RE = re.compile(r'\s*\([^)]*\)')
+
+def _is_plain_number(token: str) -> bool:
+    """True for the quantities _QTY_RE accepts: digits with an optional decimal part"""
+    whole, dot, fraction = token.partition(".")
+    return whole.isdecimal() and (fraction.isdecimal() or not dot)
+
+def parse_quantified_ingredient(ingredient_str: str) -> Optional[Dict]:
     """
-    Parse an ingredient string like "2 cups flattened rice (poha)" into a dictionary.
-    Returns: {"item": "flattened rice", "quantity": 2, "unit": "cups"}
+    Parse a "<quantity> <unit> <item>" string like "2 cups flattened rice (poha)".
+    Returns: {"item": "flattened rice", "quantity": 2, "unit": "cups"}, or None if it has no quantity and unit
     """
     ingredient_str = ingredient_str.strip()
     
-    # Common patterns for quantities and units
-    quantity_patterns = [
-        r'^(\d+(?:\.\d+)?)\s*(cups?|tablespoons?|teaspoons?|pounds?|lbs?|grams?|g|kilograms?|kg|ounces?|oz|pieces?|cloves?|bottles?|cans?|packets?|bunches?|heads?)\s+(.+)$',
-        r'^(\d+(?:\.\d+)?)\s*(cup|tablespoon|teaspoon|pound|lb|gram|kilogram|ounce|piece|clove|bottle|can|packet|bunch|head)\s+(.+)$',
-    ]
+    # Usual shape is "<number> <unit> <item>": split it with string ops and only fall
+    # back to the regex when the first token isn't a bare number (e.g. "200g rice")
+    tokens = ingredient_str.split(None, 2)
+    if tokens and _is_plain_number(tokens[0]):
+        if len(tokens) < 3 or tokens[1].lower() not in UNIT_ALIASES:
+            return None
+        quantity, unit, item = float(tokens[0]), UNIT_ALIASES[tokens[1].lower()], tokens[2]
+    else:
+        match = _QTY_RE.match(ingredient_str)
+        if not match:
+            return None
+        quantity, unit, item = float(match.group(1)), UNIT_ALIASES[match.group(2).lower()], match.group(3).strip()
     
-    for pattern in quantity_patterns:
-        match = re.search(pattern, ingredient_str, re.IGNORECASE)
-        if match:
-            quantity = float(match.group(1))
-            unit = match.group(2).lower()
-            item = match.group(3).strip()
-            
-            # Clean up the item name (remove extra parentheses, etc.)
-            item = re.sub(r'\s*\([^)]*\)', '', item).strip()  # Remove parenthetical notes
-            item = re.sub(r'\s+', ' ', item).strip()  # Normalize whitespace
-            
-            return {
-                "item": item,
-                "quantity": quantity,
-                "unit": unit
-            }
+    # Clean up the item name (remove extra parentheses, etc.)
+    if "(" in item:
+        item = _PAREN_RE.sub('', item)  # Remove parenthetical notes
+    item = " ".join(item.split())  # Normalize whitespace
+    
+    return {
+        "item": item,
+        "quantity": quantity,
+        "unit": unit
+    }
+
+def parse_ingredient_string(ingredient_str: str) -> Dict:
+    """
+    Parse an ingredient string like "2 cups flattened rice (poha)" into a dictionary.
+    Returns: {"item": "flattened rice", "quantity": 2, "unit": "cups"}
+    """
+    parsed = parse_quantified_ingredient(ingredient_str)
+    if parsed is not None:
+        return parsed
     
     # If no quantity/unit pattern found, treat as single item
     return {
-        "item": ingredient_str,
+        "item": ingredient_str.strip(),
         "quantity": 1,
         "unit": "piece"
     }
@@ -69,13 +97,43 @@ def parse_ingredients_to_dicts(ingredient_strings: List[str]) -> List[Dict]:
             parsed_ingredients.append(parsed)
     return parsed_ingredients
 
-def normalize_ingredient_openai(ingredient_str: str, openai_api_key: str) -> Dict:
-    """
-    Use OpenAI to normalize an ingredient string to canonical form, quantity, and unit.
-    Returns: {"item": ..., "quantity": ..., "unit": ...}
-    """
-    import json
-    client = openai.OpenAI(api_key=openai_api_key)
+# Structured Outputs schemas: the model can only reply with JSON of this exact shape
+_NORMALIZED_INGREDIENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "item": {"type": "string"},
+        "quantity": {"type": "number"},
+        "unit": {"type": "string"}
+    },
+    "required": ["item", "quantity", "unit"],
+    "additionalProperties": False
+}
+_NORMALIZED_INGREDIENT_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "normalized_ingredient", "strict": True, "schema": _NORMALIZED_INGREDIENT_SCHEMA}
+}
+_NORMALIZED_INGREDIENTS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "normalized_ingredients",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"ingredients": {"type": "array", "items": _NORMALIZED_INGREDIENT_SCHEMA}},
+            "required": ["ingredients"],
+            "additionalProperties": False
+        }
+    }
+}
+_NORMALIZE_SYSTEM_PROMPT = "Return JSON with keys item, quantity, unit for each ingredient."
+
+@st.cache_resource
+def get_openai_client(openai_api_key: str) -> openai.OpenAI:
+    """One client (and its connection pool) per API key, shared across reruns and sessions"""
+    return openai.OpenAI(api_key=openai_api_key)
+
+def _normalize_ingredient_request(ingredient_str: str) -> Dict:
+    """Chat completion arguments for normalizing one ingredient"""
     prompt = f"""
 Given the following ingredient: '{ingredient_str}'
 Return a JSON object with:
@@ -86,28 +144,185 @@ If the ingredient is a variant (e.g., 'red onion'), use the base item ('onion').
 If the unit is missing, use 'piece' as default.
 Respond with only the JSON object, nothing else.
 """
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _NORMALIZE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.0,
+        "max_tokens": 100,
+        "response_format": _NORMALIZED_INGREDIENT_FORMAT
+    }
+
+def _fallback_normalized_ingredient(ingredient_str: str) -> Dict:
+    """Placeholder for a string whose normalization couldn't be parsed: treat it as a single item"""
+    return {"item": ingredient_str, "quantity": 1, "unit": "piece"}
+
+def _parse_normalized_ingredient(text: Optional[str], ingredient_str: str) -> Dict:
+    try:
+        return json.loads((text or "").strip())
+    except Exception:
+        return _fallback_normalized_ingredient(ingredient_str)
+
+# Per-ingredient fallback requests allowed in flight at once
+MAX_CONCURRENT_NORMALIZATIONS = 10
+
+async def _normalize_ingredients_async(ingredient_strings: List[str], openai_api_key: str) -> List[Dict]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_NORMALIZATIONS)
+    # The async client is tied to the event loop asyncio.run creates, so it isn't cached like the sync one
+    async with openai.AsyncOpenAI(api_key=openai_api_key) as client:
+        async def normalize_one(ingredient_str: str) -> Dict:
+            async with semaphore:
+                response = await client.chat.completions.create(**_normalize_ingredient_request(ingredient_str))
+            return _parse_normalized_ingredient(response.choices[0].message.content, ingredient_str)
+        return await asyncio.gather(*(normalize_one(ing) for ing in ingredient_strings))
+
+def normalize_ingredients_concurrently_openai(ingredient_strings: List[str], openai_api_key: str) -> List[Dict]:
+    """
+    Normalize ingredient strings with one OpenAI request each, up to MAX_CONCURRENT_NORMALIZATIONS at a time.
+    Results are aligned by index.
+    """
+    return asyncio.run(_normalize_ingredients_async(ingredient_strings, openai_api_key))
+
+# Upper bound on memoized normalizations; the memo is simply emptied once it is exceeded
+MAX_NORMALIZATION_MEMO_ENTRIES = 4096
+
+@st.cache_resource
+def get_normalization_memo() -> Dict[str, Dict]:
+    """Normalized ingredient by raw string; a cached resource so it outlives script reruns"""
+    return {}
+
+def normalize_ingredients_openai(ingredient_strings: List[str], openai_api_key: str) -> List[Dict]:
+    """
+    Normalize a list of ingredient strings using OpenAI.
+    Strings seen before (in any plan or session) are served from memory; the rest go in one batched request.
+    Returned dicts are shared with the memo, so callers must not mutate them.
+    """
+    memo = get_normalization_memo()
+    found = {ing: memo.get(ing) for ing in ingredient_strings}
+    misses = [ing for ing, normalized in found.items() if normalized is None]
+    if misses:
+        normalized = normalize_ingredients_batch_openai(misses, openai_api_key)
+        found.update(zip(misses, normalized))
+        # Placeholders from unparseable responses aren't memoized, so the string is retried next time
+        learned = {
+            ing: result for ing, result in zip(misses, normalized)
+            if result != _fallback_normalized_ingredient(ing)
+        }
+        if len(memo) + len(learned) > MAX_NORMALIZATION_MEMO_ENTRIES:
+            memo.clear()
+        memo.update(learned)
+    return [found[ing] for ing in ingredient_strings]
+
+def normalize_ingredients_batch_openai(ingredient_strings: List[str], openai_api_key: str) -> List[Dict]:
+    """
+    Normalize a list of ingredient strings using OpenAI, in a single request.
+    Results are aligned by index; falls back to concurrent per-ingredient requests if the batched reply can't be used.
+    """
+    if not ingredient_strings:
+        return []
+    client = get_openai_client(openai_api_key)
+    numbered = "\n".join(f"{i}. {ing}" for i, ing in enumerate(ingredient_strings, start=1))
+    prompt = f"""
+Given the following numbered ingredients:
+{numbered}
+Return a JSON object with one key, 'ingredients': an array with exactly one entry per ingredient, in the same order, each with:
+- 'item': the canonical grocery item (e.g., 'onion', 'potato', 'milk')
+- 'quantity': the numeric quantity (float)
+- 'unit': the unit (e.g., 'pieces', 'grams', 'cups')
+If the ingredient is a variant (e.g., 'red onion'), use the base item ('onion').
+If the unit is missing, use 'piece' as default.
+Respond with only the JSON object, nothing else.
+"""
+    # API errors (auth, network, rate limits) propagate: retrying per item would only repeat them
     response = client.chat.completions.create(
         model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
+        messages=[
+            {"role": "system", "content": _NORMALIZE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
         temperature=0.0,
-        max_tokens=100
+        max_tokens=min(100 * len(ingredient_strings), 16000),
+        response_format=_NORMALIZED_INGREDIENTS_FORMAT
     )
-    text = response.choices[0].message.content
-    if text is not None:
-        text = text.strip()
-    else:
-        text = ""
     try:
-        return json.loads(text)
-    except Exception:
-        # fallback: treat as single item
-        return {"item": ingredient_str, "quantity": 1, "unit": "piece"}
+        normalized = json.loads(response.choices[0].message.content or "")["ingredients"]
+        # The schema fixes each entry's shape but not the array length
+        if len(normalized) == len(ingredient_strings):
+            return normalized
+    except (json.JSONDecodeError, KeyError, TypeError):
+        pass
+    # A short or truncated reply can't be matched back to the inputs
+    return normalize_ingredients_concurrently_openai(ingredient_strings, openai_api_key)
 
-def normalize_ingredients_openai(ingredient_strings: List[str], openai_api_key: str) -> List[Dict]:
+async def _extract_dishes_async(agent, dishes: List[str], on_done: Callable[[int], None]) -> Dict[str, List[str]]:
+    # One loop for every dish: the Agents SDK can reuse a process-wide async HTTP client,
+    # which must not be driven from several threads' event loops at once
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    async def extract_one(dish: str):
+        async with semaphore:
+            return dish, await agent.extract_ingredients_async(dish)
+    extracted = {}
+    for done, next_result in enumerate(asyncio.as_completed([extract_one(dish) for dish in dishes]), start=1):
+        dish, ingredients = await next_result
+        extracted[dish] = ingredients
+        on_done(done)
+    return extracted
+
+def extract_dishes(agent, dishes: List[str], on_done: Callable[[int], None]) -> Dict[str, List[str]]:
     """
-    Normalize a list of ingredient strings using OpenAI.
+    Extract ingredients for each dish concurrently, up to MAX_CONCURRENT_EXTRACTIONS at a time.
+    on_done(n) is called on the script thread after each of the n dishes completes.
     """
-    return [normalize_ingredient_openai(ing, openai_api_key) for ing in ingredient_strings]
+    return asyncio.run(_extract_dishes_async(agent, dishes, on_done))
+
+def prime_sheet_caches() -> None:
+    """First Sheets-backed view of a session reads inventory, orders and shopping lists in one batchGet"""
+    if not st.session_state.get("sheet_caches_primed"):
+        load_all_sheets()
+        st.session_state["sheet_caches_primed"] = True
+
+@st.cache_data
+def get_default_days(today_iso: str, num_days: int) -> List[str]:
+    """Generate list of days based on user selection; keyed on the date so it rolls over at midnight"""
+    today = datetime.date.fromisoformat(today_iso)
+    return [(today + datetime.timedelta(days=i)).strftime("%A") for i in range(num_days)]
+
+@st.fragment
+def day_by_day_form(days: List[str], meals: List[str]) -> None:
+    """Day-by-day planner; Previous/Next rerun only this fragment instead of the whole script"""
+    idx = st.session_state["current_day_idx"]
+    day = days[idx]
+    st.subheader(f"🗓️ {day}")
+    st.progress((idx + 1) / len(days), text=f"Day {idx + 1} of {len(days)}")
+    with st.form(f"form_{day}"):
+        cols = st.columns(len(meals))
+        for i, meal in enumerate(meals):
+            key = f"{day}_{meal}"
+            st.session_state["dish_plan"][day][meal] = cols[i].text_input(f"{meal}", value=st.session_state["dish_plan"][day][meal], key=key)
+        nav_cols = st.columns([1, 1, 2])
+        prev_disabled = idx == 0
+        next_disabled = idx == len(days) - 1
+        with nav_cols[0]:
+            prev = st.form_submit_button("⬅️ Previous Day", disabled=prev_disabled)
+        with nav_cols[1]:
+            next_ = st.form_submit_button("Next Day ➡️", disabled=next_disabled)
+        with nav_cols[2]:
+            finish = st.form_submit_button("Finish & Generate Shopping List")
+            if finish:
+                if not any(st.session_state["dish_plan"][d][m] for d in days for m in meals):
+                    st.error("Please fill at least one meal before generating the shopping list.")
+                else:
+                    st.session_state["current_day_idx"] = 0
+                    st.session_state["planning_view_mode"] = "summary"
+                    st.rerun()  # Whole app: the summary lives outside this fragment
+    if prev:
+        st.session_state["current_day_idx"] = max(0, idx - 1)
+        st.rerun(scope="fragment")
+    if next_:
+        st.session_state["current_day_idx"] = min(len(days) - 1, idx + 1)
+        st.rerun(scope="fragment")
 
 # --- SIDEBAR CONFIGURATION ---
 with st.sidebar:
@@ -158,25 +373,24 @@ if view_mode == "Meal Planner":
     st.title("🍽️ AI Meal Planner: Pick Your Dishes!")
     st.write("Select or type the dishes you want for each meal. The AI will generate your shopping list!")
 
-    def get_default_days(num_days: int):
-        """Generate list of days based on user selection"""
-        today = datetime.date.today()
-        return [(today + datetime.timedelta(days=i)).strftime("%A") for i in range(num_days)]
-
-    days = get_default_days(num_days)
+    days = get_default_days(datetime.date.today().isoformat(), num_days)
 
     # --- SESSION STATE ---
     if "dish_plan" not in st.session_state:
-        st.session_state["dish_plan"] = {day: {meal: "" for meal in meals} for day in days}
+        st.session_state["dish_plan"] = {}
     if "planning_view_mode" not in st.session_state:
         st.session_state["planning_view_mode"] = "day_by_day"  # or 'master'
     if "current_day_idx" not in st.session_state:
         st.session_state["current_day_idx"] = 0
 
-    # Reset session state if configuration changes
-    current_config = (num_days, tuple(meals))
-    if "last_config" not in st.session_state or st.session_state["last_config"] != current_config:
-        st.session_state["dish_plan"] = {day: {meal: "" for meal in meals} for day in days}
+    # Add empty slots when the configuration changes (including the day names rolling over at
+    # midnight); dishes already typed are kept, so re-selecting a meal or day restores them
+    current_config = (tuple(days), tuple(meals))
+    if st.session_state.get("last_config") != current_config:
+        for day in days:
+            day_plan = st.session_state["dish_plan"].setdefault(day, {})
+            for meal in meals:
+                day_plan.setdefault(meal, "")
         st.session_state["current_day_idx"] = 0
         st.session_state["last_config"] = current_config
 
@@ -194,37 +408,7 @@ if view_mode == "Meal Planner":
 
     # --- DAY-BY-DAY VIEW ---
     if st.session_state["planning_view_mode"] == "day_by_day":
-        idx = st.session_state["current_day_idx"]
-        day = days[idx]
-        st.subheader(f"🗓️ {day}")
-        st.progress((idx + 1) / len(days), text=f"Day {idx + 1} of {len(days)}")
-        with st.form(f"form_{day}"):
-            cols = st.columns(len(meals))
-            for i, meal in enumerate(meals):
-                key = f"{day}_{meal}"
-                st.session_state["dish_plan"][day][meal] = cols[i].text_input(f"{meal}", value=st.session_state["dish_plan"][day][meal], key=key)
-            nav_cols = st.columns([1, 1, 2])
-            prev_disabled = idx == 0
-            next_disabled = idx == len(days) - 1
-            with nav_cols[0]:
-                prev = st.form_submit_button("⬅️ Previous Day", disabled=prev_disabled)
-            with nav_cols[1]:
-                next_ = st.form_submit_button("Next Day ➡️", disabled=next_disabled)
-            with nav_cols[2]:
-                finish = st.form_submit_button("Finish & Generate Shopping List")
-                if finish:
-                    if not any(st.session_state["dish_plan"][d][m] for d in days for m in meals):
-                        st.error("Please fill at least one meal before generating the shopping list.")
-                    else:
-                        st.session_state["current_day_idx"] = 0
-                        st.session_state["planning_view_mode"] = "summary"
-                        st.rerun()
-        if prev:
-            st.session_state["current_day_idx"] = max(0, idx - 1)
-            st.rerun()
-        if next_:
-            st.session_state["current_day_idx"] = min(len(days) - 1, idx + 1)
-            st.rerun()
+        day_by_day_form(days, meals)
 
     # --- MASTER VIEW (ALL DAYS AT ONCE) ---
     elif st.session_state["planning_view_mode"] == "master":
@@ -244,58 +428,91 @@ if view_mode == "Meal Planner":
     # --- SUMMARY & SHOPPING LIST GENERATION ---
     if st.session_state["planning_view_mode"] == "summary":
         st.subheader("✅ Your Meal Plan Summary")
+        # One pass over the plan renders it and collects what the Sheets summary,
+        # the cache key and the extractor need
+        dish_plan = st.session_state["dish_plan"]
+        meal_plan_summary = []
+        canonical_plan = []
+        dishes = []
         for day in days:
+            day_meals = [(meal, dish) for meal in meals if (dish := dish_plan[day][meal].strip())]
+            day_text = ", ".join(f"{meal}: {dish}" for meal, dish in day_meals)
             st.write(f"**{day}:**")
-            st.write(", ".join([f"{meal}: {st.session_state['dish_plan'][day][meal]}" for meal in meals if st.session_state['dish_plan'][day][meal]]))
+            st.write(day_text)
+            if day_meals:
+                meal_plan_summary.append(f"{day}: {day_text}")
+                dishes.extend(dish for _, dish in day_meals)
+            canonical_plan.append((day, tuple(day_meals)))
         st.markdown("---")
-        st.info("🤖 Generating your shopping list with AI... (this may take a few seconds)")
         
-        # Generate meal plan summary for Google Sheets
-        meal_plan_summary = []
-        for day in days:
-            day_meals = []
-            for meal in meals:
-                dish = st.session_state["dish_plan"][day][meal].strip()
-                if dish:
-                    day_meals.append(f"{meal}: {dish}")
-            if day_meals:
-                meal_plan_summary.append(f"{day}: {', '.join(day_meals)}")
+        # Meal plan summary for Google Sheets
         meal_plan_text = " | ".join(meal_plan_summary)
         
-        ingredient_agent = get_ingredient_extractor_agent()
-        all_ingredients = []
-        for day in days:
-            for meal in meals:
-                dish = st.session_state["dish_plan"][day][meal].strip()
-                if dish:
-                    with st.spinner(f"🧠 AI is extracting ingredients for '{dish}'..."):
-                        ingredients = ingredient_agent.extract_ingredients(dish)
-                    all_ingredients.extend(ingredients)
-        
-        # Compute a hash of the current meal plan for caching
-        meal_plan_hash = hashlib.sha256(str(st.session_state["dish_plan"]).encode()).hexdigest()
+        # Fingerprint the planned dishes for caching; reruns with an unchanged plan
+        # (e.g. clicking Save) reuse the whole extraction + normalization pipeline.
+        # Only the selected days/meals feed the pipeline, in a fixed order, so only they are keyed.
+        meal_plan_hash = hashlib.blake2b(repr(tuple(canonical_plan)).encode(), digest_size=8).hexdigest()
         if "shopping_list_cache" not in st.session_state or st.session_state["shopping_list_cache"].get("hash") != meal_plan_hash:
             if not OPENAI_KEY:
                 st.error("OpenAI API key not set. Please set OPENAI_API_KEY in your .env file.")
                 st.stop()
-            st.info("🤖 Normalizing and deduplicating ingredients with OpenAI...")
-            normalized_ingredients = normalize_ingredients_openai(all_ingredients, OPENAI_KEY)
-            from collections import defaultdict
-            grouped = defaultdict(lambda: {"quantity": 0.0, "unit": None})
-            for ing in normalized_ingredients:
+            st.info("🤖 Generating your shopping list with AI... (this may take a few seconds)")
+            ingredient_agent = get_ingredient_extractor_agent()
+            # Extract each distinct dish once, keyed like the extractor's memo so "Dal" and
+            # "dal" are one dish; ingredient strings are tallied by how many planned dishes
+            # need them instead of being repeated into a flat list
+            dish_counts = Counter(dish.lower() for dish in dishes)
+            ingredient_counts: Dict[str, int] = {}
+            progress = st.progress(0.0, text=f"🧠 AI is extracting ingredients for {len(dish_counts)} dishes...")
+            # Each extraction is an independent network-bound call, so overlap them
+            extracted = extract_dishes(
+                ingredient_agent,
+                list(dish_counts),
+                lambda done: progress.progress(done / len(dish_counts), text=f"🧠 Extracted ingredients for {done} of {len(dish_counts)} dishes...")
+            )
+            progress.empty()
+            # Tally in plan order, not completion order, so the list reads the same every run
+            for dish, count in dish_counts.items():
+                for ingredient in extracted[dish]:
+                    key = ingredient.lower().strip()
+                    ingredient_counts[key] = ingredient_counts.get(key, 0) + count
+            
+            # Strings that already read as "<quantity> <unit> <item>" are parsed locally;
+            # only the ones without a recognizable quantity and unit need OpenAI
+            normalized_by_key: Dict[str, Dict] = {}
+            ambiguous = []
+            for key in ingredient_counts:
+                parsed = parse_quantified_ingredient(key)
+                if parsed is not None and parsed["item"]:
+                    normalized_by_key[key] = parsed
+                else:
+                    ambiguous.append(key)
+            if ambiguous:
+                st.info(f"🤖 Normalizing {len(ambiguous)} ingredients with OpenAI...")
+                normalized_by_key.update(zip(ambiguous, normalize_ingredients_openai(ambiguous, OPENAI_KEY)))
+            normalized_ingredients = [normalized_by_key[key] for key in ingredient_counts]
+            # (item, unit) -> [total quantity, unit as the model spelled it]
+            grouped: Dict[tuple, list] = {}
+            for ing, count in zip(normalized_ingredients, ingredient_counts.values()):
                 try:
-                    qty = float(ing.get("quantity", 0) or 0)
-                except Exception:
+                    qty = float(ing.get("quantity") or 0) * count
+                except (TypeError, ValueError):
                     qty = 0.0
-                key = (ing["item"].lower().strip(), ing["unit"].lower().strip())
-                if not isinstance(grouped[key]["quantity"], (int, float)) or grouped[key]["quantity"] is None:
-                    grouped[key]["quantity"] = 0.0
-                grouped[key]["quantity"] = float(grouped[key]["quantity"] or 0.0) + qty
-                grouped[key]["unit"] = ing["unit"]
+                unit = ing.get("unit") or "piece"
+                # Same spelling for model-normalized and locally parsed units
+                unit = canonical_unit(unit)
+                key = (ing["item"].lower().strip(), unit)
+                entry = grouped.get(key)
+                if entry is None:
+                    grouped[key] = [qty, unit]
+                else:
+                    entry[0] += qty
+                    entry[1] = unit
             deduped_ingredients = [
-                {"item": item, "quantity": data["quantity"], "unit": data["unit"]}
-                for (item, _), data in grouped.items()
+                {"item": item, "quantity": qty, "unit": unit}
+                for (item, _), (qty, unit) in grouped.items()
             ]
+            prime_sheet_caches()
             inventory_aware_list = generate_inventory_aware_shopping_list(deduped_ingredients)
             st.session_state["shopping_list_cache"] = {
                 "hash": meal_plan_hash,
@@ -318,11 +535,16 @@ if view_mode == "Meal Planner":
                     status_groups[status] = []
                 status_groups[status].append(item)
             
-            for status, items in status_groups.items():
-                st.markdown(f"**{status}:**")
-                for item in items:
-                    st.write(f"- {item['item']} x{item['quantity']} {item['unit']}")
-                st.write("")
+            # One table, grouped by status, instead of a frontend element per item
+            st.dataframe(
+                [
+                    {"Status": status, "Item": item["item"], "Quantity": item["quantity"], "Unit": item["unit"]}
+                    for status, items in status_groups.items()
+                    for item in items
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.write("✅ All ingredients are already in your inventory!")
         
@@ -341,6 +563,7 @@ elif view_mode == "Inventory Checker":
 
     # Get current inventory
     try:
+        prime_sheet_caches()
         inventory = get_inventory()
         
         # Create a data editor for the inventory
@@ -362,20 +585,22 @@ elif view_mode == "Inventory Checker":
             
             # Save changes button
             if st.button("💾 Save Changes to Google Sheets"):
-                # Clear existing inventory and add new items
-                clear_inventory_sheet()  # Clear inventory sheet
+                # Overwrite the existing inventory with the edited rows in one request
+                result = overwrite_inventory([
+                    (
+                        item["Item"].strip(),
+                        float(item["Quantity"]) if item["Quantity"] else 0.0,
+                        item["Unit"].strip() if item["Unit"] else ""
+                    )
+                    for item in edited_inventory
+                    if item["Item"] and item["Item"].strip()  # Only add non-empty items
+                ])
                 
-                # Add new items
-                for item in edited_inventory:
-                    if item["Item"].strip():  # Only add non-empty items
-                        append_inventory_item(
-                            item["Item"].strip(),
-                            float(item["Quantity"]) if item["Quantity"] else 0.0,
-                            item["Unit"].strip() if item["Unit"] else ""
-                        )
-                
-                st.success("✅ Inventory updated successfully!")
-                st.rerun()
+                if result.startswith("❌"):
+                    st.error(result)
+                else:
+                    st.success("✅ Inventory updated successfully!")
+                    st.rerun()
         else:
             st.info("No inventory items found. Add some items below:")
             
@@ -403,6 +628,7 @@ elif view_mode == "Shopping Lists":
     
     try:
         # Get all shopping lists
+        prime_sheet_caches()
         shopping_lists = get_shopping_lists()
         
         if shopping_lists:
@@ -418,10 +644,12 @@ elif view_mode == "Shopping Lists":
                     "Status": shopping_list["status"]
                 })
             
+            # Labels are rendered once per option, so look dates up by id instead of scanning the lists
+            date_created_by_id = {sl["list_id"]: sl["date_created"] for sl in shopping_lists}
             selected_list = st.selectbox(
                 "Select a shopping list to view:",
-                options=[sl["list_id"] for sl in shopping_lists],
-                format_func=lambda x: f"{x} ({next(sl['date_created'] for sl in shopping_lists if sl['list_id'] == x)})"
+                options=list(date_created_by_id),
+                format_func=lambda x: f"{x} ({date_created_by_id[x]})"
             )
             
             if selected_list:
@@ -431,10 +659,21 @@ elif view_mode == "Shopping Lists":
                 if list_items:
                     st.subheader(f"📝 Items in {selected_list}")
                     
-                    # Display items
-                    for item in list_items:
-                        status_icon = "✅" if item["status"] == "completed" else "⏳"
-                        st.write(f"{status_icon} {item['item']} x{item['quantity']} {item['unit']} ({item['status']})")
+                    # Display items as one table
+                    st.dataframe(
+                        [
+                            {
+                                "": "✅" if item["status"] == "completed" else "⏳",
+                                "Item": item["item"],
+                                "Quantity": item["quantity"],
+                                "Unit": item["unit"],
+                                "Status": item["status"]
+                            }
+                            for item in list_items
+                        ],
+                        use_container_width=True,
+                        hide_index=True
+                    )
                     
                     # Mark items as completed
                     st.subheader("Mark Items as Completed")
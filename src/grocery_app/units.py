@@ -0,0 +1,28 @@
+# src/grocery_app/units.py
+from typing import Dict
+
+# Every unit spelling the ingredient parser accepts, mapped to one canonical unit so "1 cup"
+# and "2 cups" group together and match inventory rows. "piece" stays singular to match the
+# default unit for ingredients without one.
+UNIT_ALIASES: Dict[str, str] = {
+    "cup": "cups", "cups": "cups",
+    "tablespoon": "tablespoons", "tablespoons": "tablespoons",
+    "teaspoon": "teaspoons", "teaspoons": "teaspoons",
+    "pound": "pounds", "pounds": "pounds", "lb": "pounds", "lbs": "pounds",
+    "gram": "grams", "grams": "grams", "g": "grams",
+    "kilogram": "kilograms", "kilograms": "kilograms", "kg": "kilograms",
+    "ounce": "ounces", "ounces": "ounces", "oz": "ounces",
+    "piece": "piece", "pieces": "piece",
+    "clove": "cloves", "cloves": "cloves",
+    "bottle": "bottles", "bottles": "bottles",
+    "can": "cans", "cans": "cans",
+    "packet": "packets", "packets": "packets",
+    "bunch": "bunches", "bunches": "bunches",
+    "head": "heads", "heads": "heads"
+}
+
+
+def canonical_unit(unit: str) -> str:
+    """Canonical spelling of a unit; units without an alias are just lowercased and stripped."""
+    unit_key = unit.strip().lower()
+    return UNIT_ALIASES.get(unit_key, unit_key)